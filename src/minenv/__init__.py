@@ -35,9 +35,12 @@ To avoid this, `getenv()` provides a way to cast the result:
 Now `max_connections` will be of type `int`.
 """
 
+import mmap
+import re
 import sys
 import typing
-from os import PathLike, environ
+from os import PathLike, environ, fstat, stat
+from os.path import abspath
 
 if sys.version_info >= (3, 13):
     from collections.abc import Callable, Iterable, Sequence
@@ -50,26 +53,111 @@ DefaultT = typing.TypeVar("DefaultT")
 T = typing.TypeVar("T")
 
 UNDEFINED: typing.Final = ...
-QUOTES: typing.Final[typing.Set[str]] = {'"', "'"}
 
-
-def parse_stream(stream: typing.TextIO) -> Iterable[typing.Tuple[str, str]]:
-    for line in stream:
-        content = line.strip()
-        if not content or content[0] == "#" or "=" not in content:
+# Private miss marker for `environ.get` in `get`. Comparing the looked-up
+# value against the caller's default would misfire whenever the environment
+# value is the same (interned) object as the default.
+_MISSING: typing.Final = object()
+
+# Identity-compared in `get` to skip the no-op `str(value)` call on values
+# that already come out of `environ` as `str`.
+_INTO_STR: typing.Final = str
+
+# Below this size a plain read() wins, because setting up a mapping costs
+# more than copying the file into memory.
+_MMAP_MIN_SIZE: typing.Final[int] = 4096
+
+# (absolute path, override) -> (st_mtime_ns, st_size) of files already
+# loaded, so that repeated `load()` calls skip re-reading an unchanged file.
+# The override flag is part of the key because the two modes apply the same
+# file differently.
+_LOADED: typing.Dict[typing.Tuple[str, bool], typing.Tuple[int, int]] = {}
+
+# One linear, non-backtracking pass over the line: key, then a double-quoted,
+# single-quoted or bare value. Runs entirely in C with no intermediate strings.
+_LINE: typing.Final[typing.Pattern[str]] = re.compile(
+    r"^\s*([A-Za-z_]\w*)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\n]*?))\s*$"
+)
+_LINE_BYTES: typing.Final[typing.Pattern[bytes]] = re.compile(
+    rb"^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(?:\"([^\"\n]*)\"|'([^'\n]*)'|([^\n]*?))[ \t\r]*$", re.MULTILINE
+)
+
+
+def parse_stream(stream: Iterable[str]) -> Iterable[typing.Tuple[str, str]]:
+    yield from _parse_all(stream)
+
+
+def _parse_all(
+    lines: Iterable[str], _match: Callable[[str], typing.Optional[typing.Match[str]]] = _LINE.match
+) -> typing.List[typing.Tuple[str, str]]:
+    pairs: typing.List[typing.Tuple[str, str]] = []
+    append = pairs.append
+    for line in lines:
+        if not line or line.startswith(("#", "\r", "\n")):
+            continue
+        match = _match(line)
+        if match is None:
             continue
 
-        key, _, value = content.partition("=")
-        key, value = key.strip(), value.strip()
-        if value[1] in QUOTES and value[-1] in QUOTES:
-            value = value[1:-1]
+        key, double, single, bare = match.groups()
+        value = double if double is not None else single if single is not None else bare
+        append((key, value))
+    return pairs
+
+
+def _parse_bytes(
+    data: typing.Union[bytes, mmap.mmap],
+    _finditer: Callable[[typing.Union[bytes, mmap.mmap]], typing.Iterator[typing.Match[bytes]]] = _LINE_BYTES.finditer,
+) -> typing.List[typing.Tuple[str, str]]:
+    """Parse raw file contents without decoding the whole buffer.
+
+    Only the matched key and value fields are decoded, so comments,
+    blank lines and surrounding whitespace never become `str` objects.
+    """
+    pairs: typing.List[typing.Tuple[str, str]] = []
+    append = pairs.append
+    for match in _finditer(data):
+        key, double, single, bare = match.groups()
+        value = double if double is not None else single if single is not None else bare
+        append((key.decode("UTF-8"), value.decode("UTF-8", "replace")))
+    return pairs
+
 
-        yield key, value
+def _load(path: typing.Union[str, PathLike[str]], stream: typing.Optional[Iterable[str]], override: bool) -> None:
+    mapped: typing.Optional[mmap.mmap] = None
+    try:
+        if stream is None:
+            cache_key = (abspath(path), override)
+            meta = stat(cache_key[0])
+            signature = (meta.st_mtime_ns, meta.st_size)
+            if _LOADED.get(cache_key) == signature:
+                return
+            with open(path, "rb") as file:
+                if fstat(file.fileno()).st_size > _MMAP_MIN_SIZE:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    data: typing.Union[bytes, mmap.mmap] = mapped
+                else:
+                    data = file.read()
+            pairs = _parse_bytes(data)
+        else:
+            pairs = _parse_all(stream)
+        _env = environ
+        _intern = sys.intern
+        pending = {_intern(key): value for key, value in pairs}
+        if not override:
+            for key in _env.keys() & pending.keys():
+                del pending[key]
+        _env.update(pending)
+        if stream is None:
+            _LOADED[cache_key] = signature
+    finally:
+        if mapped is not None:
+            mapped.close()
 
 
 def load(
     path: typing.Union[str, PathLike[str]] = ".env",
-    stream: typing.Optional[typing.TextIO] = None,
+    stream: typing.Optional[Iterable[str]] = None,
     *,
     override: bool = True,
     verbose: bool = False,
@@ -80,9 +168,9 @@ def load(
     ----------
     path : str or PathLike, default=".env"
         The path to the dotenv file to be loaded.
-    stream: TextIO, optional
-        A file-like object to read from instead of opening the file at `path`.
-        If provided, `path` is ignored.
+    stream: Iterable[str], optional
+        An iterable of lines (e.g. an open text file) to read from instead of
+        opening the file at `path`. If provided, `path` is ignored.
     override : bool, default=True
         Whether to override existing environment variables with values from
         the file. If `False`, existing environment variables are not overwritten.
@@ -101,17 +189,42 @@ def load(
     -----
     - Lines starting with `#` are treated as comments and are ignored.
     - Comments after a value are not supported and may cause parsing issues.
+    - Bytes that are not valid UTF-8 are replaced with `U+FFFD` rather than
+        raising, so a stray byte cannot abort the load halfway through.
+    - A file that is unchanged (same mtime and size) since its last successful
+        load is skipped. Call `load.clear_cache()` to force a re-read.
     """
     try:
-        with stream or open(path, encoding="UTF-8") as inner:
-            for key, value in parse_stream(inner):
-                if not override and environ.get(key):
-                    continue
-                environ[key] = value
+        _load(path, stream, override)
     except Exception as error:
         if verbose:
             raise error
-        return error
+        # The returned exception is usually discarded; dropping the traceback
+        # releases the frames it would otherwise pin until collection.
+        return error.with_traceback(None)
+
+
+def _clear_cache() -> None:
+    """Forget every previously loaded file so the next `load` re-reads it."""
+    _LOADED.clear()
+
+
+load.clear_cache = _clear_cache
+
+
+def _get_str_required(key: str, _env: typing.Mapping[str, str] = environ) -> str:
+    try:
+        return _env[key]
+    except KeyError:
+        raise KeyError(f"`{key}` cannot be found in environment") from None
+
+
+def _get_into(key: str, into: Callable[[typing.Any], T], _env: typing.Mapping[str, str] = environ) -> T:
+    try:
+        value = _env[key]
+    except KeyError:
+        raise KeyError(f"`{key}` cannot be found in environment") from None
+    return into(value)
 
 
 @typing.overload
@@ -141,11 +254,20 @@ def get(
     Notes
     -----
     Default value is not converting by `into`.
+
+    Pass built-in converters such as `int` or `float` directly rather than
+    wrapping them in a lambda: `into` is compared by identity to skip the
+    no-op `str` conversion, and a wrapper defeats that check while adding
+    a Python-level call per lookup.
     """
-    value: typing.Any = environ.get(key, default=default)
-    if value is UNDEFINED:
-        raise KeyError(f"`{key}` cannot be found in environment")
-    if value is None:
+    if default is UNDEFINED:
+        if into is _INTO_STR:
+            return _get_str_required(key)
+        return _get_into(key, into)
+    value: typing.Any = environ.get(key, _MISSING)
+    if value is _MISSING:
+        return default
+    if into is _INTO_STR:
         return value
     return into(value)
 